@@ -35,19 +35,103 @@ gets added, the script can be adapted to only use
 berserk and not needing manual API requests.
 """
 
+import atexit
+import concurrent.futures
 import configparser
-import datetime
+import dataclasses
+import functools
 import github
+import hashlib
+import io
 import json
-import math
 import matplotlib as mpl
+import matplotlib.backends.backend_agg
 import matplotlib.pyplot as plt
+import numpy as np
 import os
+import PIL.Image
 import random
 import requests
+import string
 import sys
 import time
 import trees
+import urllib3
+
+# Use the faster orjson parser if it is installed, and the standard library otherwise
+try:
+    import orjson
+    _JsonLoads = orjson.loads
+except ImportError:
+    _JsonLoads = json.loads
+
+# Last formatted timestamp, only reformatted when the second changes
+_LastTimestamp = [0, ""]
+
+def _Timestamp() -> str:
+    """
+    Get the current time as HH:MM:SS, for use in log lines.
+    """
+    Now = int(time.time())
+    if Now != _LastTimestamp[0]:
+        _LastTimestamp[0] = Now
+        _LastTimestamp[1] = time.strftime("%H:%M:%S", time.localtime(Now))
+    return _LastTimestamp[1]
+
+
+
+# Class to store the (immutable) configuration of a tournament
+@dataclasses.dataclass(frozen = True)
+class KnockOutConfig:
+    """
+    Configuration of a KO tournament, parsed from a configuration file.
+    """
+    GitHubUserName:     str
+    GitHubRepoName:     str
+    TeamId:             str
+    MaxParticipants:    int
+    MinParticipants:    int
+    StartAtMax:         bool
+    GamesPerMatch:      int
+    Rated:              bool
+    Variant:            str
+    ClockInit:          int
+    ClockInc:           int
+    ChatFor:            int
+    RandomizeSeeds:     bool
+    Title:              str
+    MinutesToStart:     int
+    TieBreak:           str
+
+    @classmethod
+    def FromFile(cls, ConfigFile):
+        """
+        Read and parse all configuration variables in a single pass.
+        """
+        Config = configparser.ConfigParser(inline_comment_prefixes = ";")
+        Config.read(ConfigFile)
+        GitHub = Config["GitHub"]
+        Lichess = Config["Lichess"]
+        Options = Config["Options"]
+        return cls(
+            GitHubUserName      = GitHub["Username"].strip(),
+            GitHubRepoName      = GitHub["Repository"].strip(),
+            TeamId              = Lichess["TeamId"].strip(),
+            MaxParticipants     = Options.getint("MaxParticipants"),
+            MinParticipants     = Options.getint("MinParticipants"),
+            StartAtMax          = Options.getboolean("StartAtMax"),
+            GamesPerMatch       = Options.getint("GamesPerMatch"),
+            Rated               = Options.getboolean("Rated"),
+            Variant             = Options["Variant"].strip(),
+            ClockInit           = Options.getint("ClockInit"),
+            ClockInc            = Options.getint("ClockInc"),
+            ChatFor             = Options.getint("ChatFor"),
+            RandomizeSeeds      = Options.getboolean("RandomizeSeeds"),
+            Title               = Options["EventName"].strip(),
+            MinutesToStart      = Options.getint("MinutesToStart"),
+            TieBreak            = Options["TieBreak"])
+
+
 
 # Class to keep track of variables
 class KnockOut:
@@ -72,6 +156,10 @@ class KnockOut:
     _Bracket_ColorDraw          = (123/255, 153/255, 153/255)
     _Bracket_ColorArrow         = ( 60/255,  60/255,  60/255)
 
+    # Names of rounds, indexed by the number of matches in that round
+    _Bracket_RoundNames         = {1: "Finals", 2: "Semifinals", 4: "Quarterfinals",
+                                   **{1 << i: f"Round of {1 << (i + 1)}" for i in range(3, 15)}}
+
     # Background colors
     _Bracket_ColorBGAll         = ( 22/255,  21/255,  18/255)
     _Bracket_ColorBGScoreBlack  = ( 33/255,  31/255,  28/255)
@@ -82,6 +170,18 @@ class KnockOut:
     _ApiDelay                   = 3       # Wait 3 seconds between API requests
     _ApiAttempts                = 5       # Retry 5 times at API endpoints before giving up
 
+    # Placeholder participant data for empty spots in the bracket (read-only)
+    _ByeParticipant             = {"username": "BYE", "rating": 0, "points": 0.0, "seed": -1}
+
+    # Game results as printed in the logs, from the perspective of the first player
+    _GameResultStrings          = {0: "0-1", 0.5: "½-½", 1: "1-0"}
+
+    # Allowed characters in user-provided names
+    _NameChars                  = frozenset(string.ascii_letters + string.digits + ",.-_")
+    _RepoChars                  = frozenset(string.ascii_letters + string.digits + ".-_")
+    _TeamChars                  = frozenset(string.ascii_letters + string.digits + "-")
+    _EventChars                 = frozenset(string.ascii_letters + string.digits + " ,.-")
+
     def __init__(self, LichessToken, GitHubToken, ConfigFile):
         """
         Initialize a new KO tournament object.
@@ -92,24 +192,28 @@ class KnockOut:
         self._GitHubToken       = GitHubToken
 
         # Load configuration variables
-        Config                  = configparser.ConfigParser(inline_comment_prefixes = ";")
-        Config.read(self._ConfigFile)
-        self._GitHubUserName    = Config["GitHub"]["Username"].strip()
-        self._GitHubRepoName    = Config["GitHub"]["Repository"].strip()
-        self._TeamId            = Config["Lichess"]["TeamId"].strip()
-        self._MaxParticipants   = int(Config["Options"]["MaxParticipants"])
-        self._MinParticipants   = int(Config["Options"]["MinParticipants"])
-        self._StartAtMax        = Config["Options"].getboolean("StartAtMax")
-        self._GamesPerMatch     = int(Config["Options"]["GamesPerMatch"])
-        self._Rated             = Config["Options"].getboolean("Rated")
-        self._Variant           = Config["Options"]["Variant"].strip()
-        self._ClockInit         = int(Config["Options"]["ClockInit"])
-        self._ClockInc          = int(Config["Options"]["ClockInc"])
-        self._ChatFor           = int(Config["Options"]["ChatFor"])
-        self._RandomizeSeeds    = Config["Options"].getboolean("RandomizeSeeds")
-        self._Title             = Config["Options"]["EventName"].strip()
-        self._MinutesToStart    = int(Config["Options"]["MinutesToStart"])
-        self._TieBreak          = Config["Options"]["TieBreak"]
+        Config                  = KnockOutConfig.FromFile(self._ConfigFile)
+        self._GitHubUserName    = Config.GitHubUserName
+        self._GitHubRepoName    = Config.GitHubRepoName
+        self._TeamId            = Config.TeamId
+        self._MaxParticipants   = Config.MaxParticipants
+        self._MinParticipants   = Config.MinParticipants
+        self._StartAtMax        = Config.StartAtMax
+        self._GamesPerMatch     = Config.GamesPerMatch
+        self._Rated             = Config.Rated
+        self._Variant           = Config.Variant
+        self._ClockInit         = Config.ClockInit
+        self._ClockInc          = Config.ClockInc
+        self._ChatFor           = Config.ChatFor
+        self._RandomizeSeeds    = Config.RandomizeSeeds
+        self._Title             = Config.Title
+        self._MinutesToStart    = Config.MinutesToStart
+        self._TieBreak          = Config.TieBreak
+
+        # Pooled HTTP session, so that connections are kept alive between API requests
+        # Note: the less frequently used sessions are only created on first use, see _GitHubSession
+        self._LichessSession    = self._MakeSession(self._LichessToken)
+        self._LastRequestTime   = 0.0           # Time at which the last API request finished
 
         # Check validity of input data, rule out PEBKAC
         self._ValidateInput()
@@ -117,19 +221,25 @@ class KnockOut:
         # Variables which should not be modified
         self._SwissId           = None
         self._SwissUrl          = None
+        self._BracketFile       = None
+        self._BracketBytes      = None                      # Encoded PNG of the last saved bracket
+        self._BracketHash       = None                      # SHA-256 of the last uploaded bracket image
+        self._BracketSha        = None                      # GitHub blob SHA of the last uploaded bracket image
         self._Winner            = None
         self._Loser             = None
-        self._MatchRounds       = math.ceil(math.log2(self._MaxParticipants))
+        self._MatchRounds       = (self._MaxParticipants - 1).bit_length()     # Equals ceil(log2(MaxParticipants))
         self._TotalRounds       = self._GamesPerMatch * self._MatchRounds
         self._SkippedRounds     = 0                         # If matches get decided early, increment by 1
         self._TreeSize          = 2 ** self._MatchRounds    # If e.g. 5 players, it is 8
+        self._Bracket_PrecomputeRoundTitles()
 
         # Decide white/black in initial games in each match
         # - Value 0 gives bottom player in bracket white first
         # - Value 1 gives top player in bracket white first
-        self._TopGetsWhite      = [random.randrange(0, 2) for _ in range(self._MatchRounds)]
+        # - Bit r of the integer below stores the coin flip for match round r
+        self._TopGetsWhiteBits  = random.getrandbits(max(1, self._MatchRounds))
         self.tprint("Coin flips for colors in bracket: ")
-        self.tprint(self._TopGetsWhite)
+        self.tprint([(self._TopGetsWhiteBits >> r) & 1 for r in range(self._MatchRounds)])
 
         self._Description       = f"Knock-out tournament for up to {self._MaxParticipants} players. "
         self._Description      += f"Each match consists of {self._GamesPerMatch} game{'s' if (self._GamesPerMatch > 1) else ''}. "
@@ -140,7 +250,11 @@ class KnockOut:
             self._Description  += "In case of a tie, the lower-rated player advances. "
         self._Started           = False
         self._UnconfirmedParticipants = dict()  # The players registered on Lichess
+        self._ETags             = dict()        # ETags of earlier conditional GET-requests
+        self._SwissStatus       = None          # Last fetched state of the Swiss event
         self._Participants      = dict()        # The players registered, confirmed to play, with scores
+        self._ParticipantsDirty = False         # Whether players joined or left since the last sort
+        self._RatingByPlayer    = dict()        # Ratings of the confirmed players, set at the start
         self._AllowedPlayers    = ""
         self._CurGame           = -1
         self._CurMatch          = -1
@@ -169,16 +283,21 @@ class KnockOut:
         # No file name known yet, so no log yet
         self._LogFile           = None
 
-        # Set up a github authentication workflow
-        while True:
-            try:
-                auth = github.Auth.Token(self._GitHubToken)
-                g = github.Github(auth = auth)
-                self._GitHubRepo = g.get_user().get_repo(self._GitHubRepoName)
-                break
-            except:
-                self.tprint("Failing to connect to GitHub. Retrying...")
-                time.sleep(self._ApiDelay)
+        # No bracket figure drawn yet
+        self._fig               = None
+        self._ax                = None
+        self._Bracket_SchemeDrawn       = False     # Whether the static skeleton is on the figure
+        self._Bracket_DynamicArtists    = []        # Artists which change between redraws
+        self._Bracket_Signature         = None      # Hash of the data in the last saved bracket
+
+        # Bracket uploads run in the background, one at a time and in order
+        self._UploadPool        = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+        self._PendingUpload     = None
+        self._PendingUploadNew  = False
+        self._PendingUploadHash = None      # SHA-256 of the image in the pending upload
+        self._BracketCreated    = False     # Whether the bracket file was created on GitHub
+
+        # Note: the GitHub repository is only connected to on first use, see _GitHubRepo
 
 
 
@@ -192,23 +311,17 @@ class KnockOut:
         """
         self.tprint("Start validating user input...")
 
-        # Convenient for checking validity of various strings
-        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        numeric = "0123456789"
-
         # GitHub username
-        NameChars = alphabet + numeric + ",.-_"
         NameLength = 39
-        assert (all([x in NameChars for x in self._GitHubUserName])), "Invalid GitHub username"
+        assert (not (set(self._GitHubUserName) - self._NameChars)), "Invalid GitHub username"
         assert (len(self._GitHubUserName) <= NameLength), "GitHub username too long"
         assert (len(self._GitHubUserName) >= 1), "GitHub username too short"
 
         # GitHub repository
-        RepoChars = alphabet + numeric + ".-_"
-        assert (all([(x in RepoChars) for x in self._GitHubRepoName])), "Invalid GitHub repository"
+        assert (not (set(self._GitHubRepoName) - self._RepoChars)), "Invalid GitHub repository"
         RepoEndpoint = f"https://api.github.com/repos/{self._GitHubUserName}/{self._GitHubRepoName}"
         Response = self._RunGetRequest(RepoEndpoint, False, AuthorizeLichess=False, AuthorizeGitHub=True)
-        JResponse = Response.json()
+        JResponse = _JsonLoads(Response.content)
         assert ("id" in JResponse), "GitHub repository not found"
         assert ("permissions" in JResponse), "GitHub token invalid"
         assert (JResponse["permissions"].get("push", False)), "GitHub token does not permit pushing"
@@ -216,23 +329,21 @@ class KnockOut:
         # Lichess user token
         TokenEndpoint = "https://lichess.org/api/token/test"
         Response = self._RunPostRequest(TokenEndpoint, self._LichessToken)
-        JResponse = Response.json()
+        JResponse = _JsonLoads(Response.content)
         assert (self._LichessToken in JResponse), "Invalid Lichess token"
         assert ("tournament:write" in JResponse[self._LichessToken]["scopes"]), "Incorrect Lichess token scopes"
         self._LichessUsername = JResponse[self._LichessToken].get("userId")
 
         # Lichess team name
-        TeamChars = alphabet + numeric + "-"
-        assert (all([x in TeamChars for x in self._TeamId])), "Invalid Lichess team ID"
+        assert (not (set(self._TeamId) - self._TeamChars)), "Invalid Lichess team ID"
         TeamEndpoint = f"https://lichess.org/api/team/{self._TeamId}"
         Response = self._RunGetRequest(TeamEndpoint, False, True)
-        TeamResponse = Response.json()
+        TeamResponse = _JsonLoads(Response.content)
         assert ("id" in TeamResponse), "Lichess team not found"
         # Cannot check if user is team leader, as it can be hidden
 
         # Event name
-        EventChars = alphabet + numeric + " ,.-"
-        assert (all([x.lower() in EventChars for x in self._Title])), "Illegal event name"
+        assert (not (set(self._Title.lower()) - self._EventChars)), "Illegal event name"
         assert ((len(self._Title) in range(2, 31)) or (self._Title == "")), "Event name has improper length"
 
         # Tiebreak criterium
@@ -295,8 +406,47 @@ class KnockOut:
 
 
 
-    def _BracketFile(self) -> str:
-        return f"png{os.sep}{self._SwissId}.png"
+    def _SeedParticipants(self):
+        """
+        Order the participants by rating or randomly, and
+        assign seeds to them in that order.
+        """
+        if self._RandomizeSeeds:
+            # Do random shuffle of seeds
+            TempList = list(self._Participants.items())
+            random.shuffle(TempList)
+            self._Participants = dict(TempList)
+        else:
+            # Sort by rating, with the key looked up once per player
+            self._Participants = dict(sorted(self._Participants.items(), key=lambda item: item[1]["rating"], reverse = True))
+
+        # Assign seeds to participants
+        for Seed, User in enumerate(self._Participants.values(), start = 1):
+            User["seed"] = Seed
+
+
+
+    def _InitialPairings(self) -> list:
+        """
+        Build the pairings of the first match round,
+        by placing the seeded participants in the seed tree.
+        """
+        PairingList = []
+        SeedTree = trees.Trees[self._TreeSize]
+        ListPlayers = list(self._Participants.keys())
+        for i in range(self._TreeSize):
+
+            # Get seed number
+            t = SeedTree[i] - 1
+
+            # Store right player in PairingList
+            if t < len(ListPlayers):
+                PairingList.append([ListPlayers[t], False, []])
+            else:
+                PairingList.append(["BYE", False, []])
+
+        assert (len(PairingList) == self._TreeSize), "Weird pairing list error"
+        return PairingList
 
 
 
@@ -311,55 +461,37 @@ class KnockOut:
         Player2 = Bracket2[0]
         Score1 = sum(Bracket1[2])
         Score2 = sum(Bracket2[2])
-
-        User1 = self._Participants.get(Player1,
-                    {"username": "BYE", "rating": 0, "points": 0.0, "seed": -1})
-        User2 = self._Participants.get(Player2,
-                    {"username": "BYE", "rating": 0, "points": 0.0, "seed": -1})
+        Half = self._GamesPerMatch / 2
 
         # Player 1 won outright with more than 50% score (or opponent is a bye)
-        if (Score1 > self._GamesPerMatch / 2 + 0.1) or (User2["username"] == "BYE"):
+        if (Score1 > Half + 0.1) or (Player2 == "BYE"):
             Player1Won = True
 
         # Player 2 won outright with more than 50% score (or opponent is a bye)
-        elif (Score2 > self._GamesPerMatch / 2 + 0.1) or (User1["username"] == "BYE"):
+        elif (Score2 > Half + 0.1) or (Player1 == "BYE"):
             Player2Won = True
 
-        # Tiebreak decisions
+        # Tiebreak decisions: a player with (at least) 50% score wins if the tiebreak favors them
         else:
 
             # Method 1: by rating -- lower-rated player wins
             if (self._TieBreak == "rating"):
-                # Lower-rated player wins
-                if (Score1 > self._GamesPerMatch / 2 - 0.1) and (User1["rating"] <= User2["rating"]):
-                    Player1Won = True
-                elif (Score2 > self._GamesPerMatch / 2 - 0.1) and (User2["rating"] <= User1["rating"]):
-                    Player2Won = True
+                Rating1 = self._RatingByPlayer[Player1]
+                Rating2 = self._RatingByPlayer[Player2]
+                (TieBreak1, TieBreak2) = ((Rating1 <= Rating2), (Rating2 <= Rating1))
 
             # Method 2: by color -- more black games wins
-            elif (self._TieBreak == "color"):
-                # Determine winner by color
-                if (Score1 > self._GamesPerMatch / 2 - 0.1) and (not self._TopGetsWhite[self._CurMatch]):
-                    Player1Won = True
-                elif (Score2 > self._GamesPerMatch / 2 - 0.1) and (self._TopGetsWhite[self._CurMatch]):
-                    Player2Won = True
-
-            # Method 3: Armageddon -- only last game if tie, and then decide by color
+            # Method 3: Armageddon -- after the final Armageddon game, also decide on black games
+            elif (self._TieBreak == "color") or (len(Bracket1[2]) >= self._GamesPerMatch):
+                TopGetsWhite = bool((self._TopGetsWhiteBits >> self._CurMatch) & 1)
+                (TieBreak1, TieBreak2) = ((not TopGetsWhite), TopGetsWhite)
+
+            # Method 3: Armageddon -- before the Armageddon game, a score of 0.5 less also wins
             else: # if (self._TieBreak == "armageddon")
+                (TieBreak1, TieBreak2) = (True, True)
 
-                # Before Armageddon game, a score of 0.5 less also wins
-                if len(Bracket1[2]) < self._GamesPerMatch:
-                    if Score1 > (self._GamesPerMatch) / 2 - 0.1:
-                        Player1Won = True
-                    elif Score2 > (self._GamesPerMatch) / 2 - 0.1:
-                        Player2Won = True
-
-                # After final Armageddon game, decide tiebreak on black games
-                else:
-                    if (Score1 > self._GamesPerMatch / 2 - 0.1) and (not self._TopGetsWhite[self._CurMatch]):
-                        Player1Won = True
-                    elif (Score2 > self._GamesPerMatch / 2 - 0.1) and (self._TopGetsWhite[self._CurMatch]):
-                        Player2Won = True
+            Player1Won = (Score1 > Half - 0.1) and TieBreak1
+            Player2Won = (not Player1Won) and (Score2 > Half - 0.1) and TieBreak2
 
 
         assert (not Player1Won or not Player2Won), "How did both win?"
@@ -374,8 +506,9 @@ class KnockOut:
         Check if all matches were decided early, in which case
         no new round for this match needs to be scheduled.
         """
-        for i in range(len(self._Pairings[-1]) // 2):
-            if (not self._Pairings[-1][2*i][1]) and (not self._Pairings[-1][2*i+1][1]):
+        Round = self._Pairings[-1]
+        for i in range(len(Round) // 2):
+            if (not Round[2*i][1]) and (not Round[2*i+1][1]):
                 return False
         return True
 
@@ -386,7 +519,7 @@ class KnockOut:
     # =======================================================
 
     def tprint(self, s):
-        ToPrint = f"{datetime.datetime.now().strftime('%H:%M:%S')}: {s}"
+        ToPrint = f"{_Timestamp()}: {s}"
         print(ToPrint)
         if hasattr(self, "_LogFile") and (self._LogFile is not None):
             self._LogFile.write(ToPrint + "\n")
@@ -403,8 +536,9 @@ class KnockOut:
         if len(self._Participants) == 0:
             self.tprint("   (No participants yet.)")
         else:
-            for Seed, (ParticipantName, Participant) in enumerate(self._Participants.items()):
-                self.tprint(f"{(Seed + 1):>2}. {Participant['username']:<20} ({Participant['rating']:>4}) [{ParticipantName}]")
+            Lines = [f"{(Seed + 1):>2}. {Participant['username']:<20} ({Participant['rating']:>4}) [{ParticipantName}]"
+                     for Seed, (ParticipantName, Participant) in enumerate(self._Participants.items())]
+            self.tprint("\n".join(Lines))
         self.tprint("")
 
 
@@ -419,9 +553,11 @@ class KnockOut:
         if len(self._Pairings) == 0:
             self.tprint("   (No matches yet.)")
         else:
-             for i in range(len(self._Pairings[-1]) // 2):
-                MatchScores = ",".join([f"{x}-{1-x}" for x in self._Pairings[-1][2*i][2]])
-                self.tprint(f"{self._Pairings[-1][2*i][0]:>20} - {self._Pairings[-1][2*i+1][0]:<20} : {MatchScores}")
+            Pairings = self._Pairings[-1]
+            Lines = [f"{Pairings[2*i][0]:>20} - {Pairings[2*i+1][0]:<20} : "
+                     f"{','.join(map(self._GameResultStrings.__getitem__, Pairings[2*i][2]))}"
+                     for i in range(len(Pairings) // 2)]
+            self.tprint("\n".join(Lines))
         self.tprint("")
 
 
@@ -430,36 +566,119 @@ class KnockOut:
     #       API request handling
     # =======================================================
 
-    def _RunGetRequest(self, RequestEndpoint: str, KillOnFail: bool, AuthorizeLichess: bool = True, AuthorizeGitHub: bool = False):
+    def _MakeSession(self, Token: str = None) -> requests.Session:
+        """
+        Create an HTTP session which reuses connections between requests,
+        and which retries failed requests with an exponential backoff.
+        """
+        Session = requests.Session()
+        if Token is not None:
+            Session.headers.update({"Authorization": f"Bearer {Token}"})
+        Retries = urllib3.util.Retry(total = self._ApiAttempts,
+                    backoff_factor = self._ApiDelay,
+                    status_forcelist = [429, 500, 502, 503, 504],
+                    allowed_methods = None)
+        Session.mount("https://", requests.adapters.HTTPAdapter(
+                    pool_connections = 4,
+                    pool_maxsize = 16,
+                    max_retries = Retries))
+        return Session
+
+
+
+    @functools.cached_property
+    def _GitHubSession(self) -> requests.Session:
+        """
+        HTTP session authorized for GitHub, created the first time it is needed.
+        """
+        return self._MakeSession(self._GitHubToken)
+
+
+
+    @functools.cached_property
+    def _PublicSession(self) -> requests.Session:
+        """
+        HTTP session without authorization, created the first time it is needed.
+        """
+        return self._MakeSession()
+
+
+
+    def _CloseSessions(self):
+        """
+        Close the HTTP sessions, releasing their pooled connections.
+        Sessions which were never used are not created just to close them.
+        """
+        self._LichessSession.close()
+        for Name in ("_GitHubSession", "_PublicSession"):
+            if Name in self.__dict__:
+                self.__dict__.pop(Name).close()
+
+
+
+    @functools.cached_property
+    def _GitHubRepo(self):
+        """
+        Set up a GitHub authentication workflow, the first time the repository is needed.
+        Retries with an exponential backoff, and gives up after a number of attempts.
+        """
+        for i in range(self._ApiAttempts):
+            try:
+                auth = github.Auth.Token(self._GitHubToken)
+                g = github.Github(auth = auth)
+                return g.get_user().get_repo(self._GitHubRepoName)
+            except Exception:
+                self.tprint(f"Failing to connect to GitHub. Attempt {i+1}/{self._ApiAttempts}.")
+                time.sleep(self._ApiDelay * (2 ** i))
+        raise RuntimeError("Unable to connect to GitHub!")
+
+
+
+    def _PaceRequests(self):
+        """
+        Keep at least _ApiDelay seconds between consecutive API requests.
+        Time spent on other work since the last request counts towards this.
+        """
+        Wait = self._LastRequestTime + self._ApiDelay - time.time()
+        if Wait > 0:
+            time.sleep(Wait)
+
+
+
+    def _RunGetRequest(self, RequestEndpoint: str, KillOnFail: bool, AuthorizeLichess: bool = True, AuthorizeGitHub: bool = False, Conditional: bool = False):
         """
         Run an API request, and handle potential errors.
         If the flag KillOnFail is true, the tournament will be aborted
         if no proper response is obtained from the server.
+        If the flag Conditional is true, the ETag of the last response is
+        sent along, and None is returned if the resource did not change.
+        Retries are handled by the session itself.
         """
         self.tprint(f"GET-request to {RequestEndpoint}.")
 
-        # Try to run the request a number of times
-        RequestSuccess = False
-        for i in range(self._ApiAttempts):
-            try:
-                if AuthorizeLichess:
-                    Response = requests.get(RequestEndpoint,
-                                headers = {"Authorization": f"Bearer {self._LichessToken}"})
-                elif AuthorizeGitHub:
-                    Response = requests.get(RequestEndpoint,
-                                headers = {"Authorization": f"Bearer {self._GitHubToken}"})
-                else:
-                    Response = requests.get(RequestEndpoint)
-                Response.raise_for_status()
-                RequestSuccess = True
-                break
-            except:
-                self.tprint(f"GET-request at {RequestEndpoint} failed!")
-                self.tprint(f"Attempt {i+1}/{self._ApiAttempts}. {f'Trying again in {self._ApiDelay} seconds...' if i < self._ApiAttempts - 1 else ''}")
-                time.sleep(self._ApiDelay)
+        # Ask the server to only send the resource if it changed
+        Headers = dict()
+        if Conditional and (RequestEndpoint in self._ETags):
+            Headers["If-None-Match"] = self._ETags[RequestEndpoint]
 
-        # Exit if we did not succeed creating a tournament
-        if not RequestSuccess:
+        # Pick the session with the right authorization
+        if AuthorizeLichess:
+            Session = self._LichessSession
+        elif AuthorizeGitHub:
+            Session = self._GitHubSession
+        else:
+            Session = self._PublicSession
+
+        # Run the request, which is retried a number of times on failure
+        self._PaceRequests()
+        try:
+            Response = Session.get(RequestEndpoint, headers = Headers)
+            Response.raise_for_status()
+        except Exception as Error:
+            self.tprint(f"GET-request at {RequestEndpoint} failed!")
+            self.tprint(Error)
+            if getattr(Error, "response", None) is not None:
+                self.tprint(Error.response.content)
             self.tprint(f"Unable to process GET-request!")
             if KillOnFail:
                 self._Terminate()
@@ -467,8 +686,13 @@ class KnockOut:
             sys.exit()
 
         # Return response if everything worked successfully
-        self.tprint(f"GET-request succeeded! Continuing in {self._ApiDelay} seconds...")
-        time.sleep(self._ApiDelay)
+        self._LastRequestTime = time.time()
+        self.tprint(f"GET-request succeeded!")
+        if Conditional:
+            if Response.status_code == 304:
+                return None
+            if "ETag" in Response.headers:
+                self._ETags[RequestEndpoint] = Response.headers["ETag"]
         return Response
 
 
@@ -477,28 +701,20 @@ class KnockOut:
         Run an API request, and handle potential errors.
         If the flag KillOnFail is set to true, the tournament will be aborted
         if no proper response is obtained from the server.
+        Retries are handled by the session itself.
         """
         self.tprint(f"POST-request to {RequestEndpoint}.")
 
-        # Try to run the request a number of times
-        RequestSuccess = False
-        for i in range(self._ApiAttempts):
-            try:
-                Response = requests.post(RequestEndpoint,
-                                headers = {"Authorization": f"Bearer {self._LichessToken}"},
-                                data = RequestData)
-                Response.raise_for_status()
-                RequestSuccess = True
-                break
-            except:
-                self.tprint(f"POST-request at {RequestEndpoint} failed!")
-                self.tprint(Response)
-                self.tprint(Response.content)
-                self.tprint(f"Attempt {i+1}/{self._ApiAttempts}. {f'Trying again in {self._ApiDelay} seconds...' if i < self._ApiAttempts - 1 else ''}")
-                time.sleep(self._ApiDelay)
-
-        # Exit if we did not succeed creating a tournament
-        if not RequestSuccess:
+        # Run the request, which is retried a number of times on failure
+        self._PaceRequests()
+        try:
+            Response = self._LichessSession.post(RequestEndpoint, data = RequestData)
+            Response.raise_for_status()
+        except Exception as Error:
+            self.tprint(f"POST-request at {RequestEndpoint} failed!")
+            self.tprint(Error)
+            if getattr(Error, "response", None) is not None:
+                self.tprint(Error.response.content)
             self.tprint(f"Unable to process POST-request!")
             if KillOnFail:
                 self._Terminate()
@@ -506,11 +722,26 @@ class KnockOut:
             sys.exit()
 
         # Return response if everything worked successfully
-        self.tprint(f"POST-request succeeded! Continuing in {self._ApiDelay} seconds...")
-        time.sleep(self._ApiDelay)
+        self._LastRequestTime = time.time()
+        self.tprint(f"POST-request succeeded!")
         return Response
 
 
+    def _EditRequestData(self) -> dict:
+        """
+        Base fields for every edit of the Swiss event once signup has opened:
+        Lichess requires the clock and number of rounds, and the allow list must be kept.
+        Callers add the fields they actually want to change.
+        """
+        RequestData = dict()
+        RequestData["clock.limit"]          = self._ClockInit
+        RequestData["clock.increment"]      = self._ClockInc
+        RequestData["nbRounds"]             = self._TotalRounds
+        RequestData["conditions.allowList"] = self._AllowedPlayers
+        return RequestData
+
+
+
     def _Terminate(self):
         """
         In some cases we may wish to terminate the tournament at once.
@@ -527,17 +758,31 @@ class KnockOut:
     #       Bracket visualization
     # =======================================================
 
+    def _Bracket_PrecomputeGeometry(self):
+        """
+        Precompute the coordinates of all match blocks in the bracket,
+        as well as the directions of the arrows between rounds.
+        """
+        self._PowRound = [1 << r for r in range(self._MatchRounds + 2)]
+        self._XBaseByR = np.arange(self._MatchRounds, dtype = np.float64) * self._Xw
+        self._YBaseByR = [(self._PowRound[r] - 1) * (self._Yh + self._Ys) / 2
+                          + self._PowRound[r] * np.arange(self._TreeSize >> (r + 1)) * (self._Yh + self._Ys)
+                          for r in range(self._MatchRounds)]
+        self._SgnByI = 1 - ((np.arange(self._TreeSize) & 1) << 1)
+
+
+
     def _Bracket_GetCoordinates(self, r, i):
         """
         Get the coordinates of the i'th match in round r.
         """
-        x = r * self._Xw
-        y = (2**r - 1) * (self._Yh + self._Ys) / 2 + 2**r * i * (self._Yh + self._Ys)
-        return (x, y)
+        return (self._XBaseByR[r], self._YBaseByR[r][i])
 
 
 
-    def _Bracket_FormatScore(self, s):
+    @staticmethod
+    @functools.lru_cache(maxsize = 128)
+    def _Bracket_FormatScore(s):
         """
         Format a score without decimals and with halves.
         """
@@ -548,6 +793,16 @@ class KnockOut:
 
 
 
+    @staticmethod
+    @functools.lru_cache(maxsize = 8)
+    def _Bracket_LoadImage(FileName):
+        """
+        Load an image from disk, decoding each file only once.
+        """
+        return plt.imread(FileName)
+
+
+
     def _Bracket_Initialize(self):
         """
         Initialize drawing, and instantiate variables.
@@ -565,11 +820,28 @@ class KnockOut:
         self._Ytotal = self._TreeSize // 2 * (self._Yh + self._Ys) - self._Ys
         self._Ytotal += 2       # Make room for round titles
 
-        # Initialize new, empty figure
-        plt.figure()
-        plt.style.use(['dark_background'])
-        self._fig, self._ax = plt.subplots(figsize = (self._Xtotal/2, self._Ytotal/2))
-        self._fig.patch.set_facecolor(self._Bracket_ColorBGAll)
+        # Reuse the existing figure if its size still fits, otherwise initialize a new, empty figure
+        FigSize = (self._Xtotal/2, self._Ytotal/2)
+        if (self._fig is not None) and (tuple(self._fig.get_size_inches()) == FigSize):
+            self._Bracket_Reset()
+        else:
+            if self._fig is not None:
+                plt.close(self._fig)
+            plt.style.use(['dark_background'])
+            self._fig, self._ax = plt.subplots(figsize = FigSize)
+            self._fig.patch.set_facecolor(self._Bracket_ColorBGAll)
+            self._Canvas = mpl.backends.backend_agg.FigureCanvasAgg(self._fig)
+            self._Bracket_SchemeDrawn = False
+            self._Bracket_DynamicArtists = []
+
+            # Coordinates of all blocks in the bracket, which only change with the figure size
+            self._Bracket_PrecomputeGeometry()
+
+        # Fix the axes limits up front, so adding artists never triggers autoscaling
+        self._ax.set_xlim(0, self._Xtotal)
+        self._ax.set_ylim(0, self._Ytotal)
+        self._ax.set_autoscale_on(False)
+        self._TextQueue = []
 
         # List of display information depending on win/loss/draw
         self._Bracket_DisplayScores = []
@@ -589,73 +861,95 @@ class KnockOut:
             "Weight": "bold",
             "WeightGame": "bold"})
 
+        # Flat lookup tables for single game results, indexed by twice the score
+        self._Bracket_GameScoreLUT = ("0", "½", "1")
+        self._Bracket_GameWeightLUT = tuple(d["WeightGame"] for d in self._Bracket_DisplayScores)
+        self._Bracket_GameColorLUT = tuple(d["ColorGame"] for d in self._Bracket_DisplayScores)
 
 
-    def _Bracket_DrawMatchBlock(self, r, i):
+
+    def _Bracket_DrawMatchBlocks(self):
         """
-        Draw the blocks representing matches.
+        Draw the blocks representing matches, for all rounds at once.
         """
-        # Name box
-        (XBase, YBase) = self._Bracket_GetCoordinates(r, i)
-        self._ax.add_patch(mpl.patches.Rectangle((XBase, YBase), self._Xn, self._Yh,
-                     facecolor = self._Bracket_ColorBGName,
-                     fill = True,
-                     lw = 0))
+        NameRects = []
+        ScoreRects = []
+        WhiteRects = []
+        for r in range(self._MatchRounds):
+            MatchesInRound = self._TreeSize >> (r + 1)
+            for i in range(MatchesInRound):
+
+                # Name box
+                (XBase, YBase) = self._Bracket_GetCoordinates(r, i)
+                NameRects.append(mpl.patches.Rectangle((XBase, YBase), self._Xn, self._Yh))
+
+                # Score box
+                ScoreRects.append(mpl.patches.Rectangle((XBase + self._Xn, YBase),
+                             self._GamesPerMatch * self._Xg + 0.2,
+                             self._Yh))
 
-        # Score box
-        self._ax.add_patch(mpl.patches.Rectangle((XBase + self._Xn, YBase),
-                     self._GamesPerMatch * self._Xg + 0.2,
-                     self._Yh,
-                     facecolor = self._Bracket_ColorBGScoreBlack,
-                     fill = True,
-                     lw = 0))
+                # White/black: alternating shading to indicate who was white
+                for g in range(self._GamesPerMatch):
+                    WhiteRects.append(mpl.patches.Rectangle((XBase + self._Xn + g * self._Xg + (0.1 if g > 0 else 0),
+                                YBase + ((g + 1 + (self._TopGetsWhiteBits >> r)) & 1) * self._Yh / 2),
+                                self._Xg + (0.1 if (g == 0) else 0) + (0.1 if (g == self._GamesPerMatch - 1) else 0),
+                                self._Yh / 2))
 
-        # White/black: alternating shading to indicate who was white
-        for g in range(self._GamesPerMatch):
-            self._ax.add_patch(mpl.patches.Rectangle((XBase + self._Xn + g * self._Xg + (0.1 if g > 0 else 0),
-                        YBase + ((g + 1 + self._TopGetsWhite[r]) % 2) * self._Yh / 2),
-                        self._Xg + (0.1 if (g == 0) else 0) + (0.1 if (g == self._GamesPerMatch - 1) else 0),
-                        self._Yh / 2,
-                        facecolor = self._Bracket_ColorBGScoreWhite,
-                        fill = True,
-                        lw = 0))
+        # Add each group of rectangles to the figure as a single collection
+        for (Rects, Color) in [(NameRects, self._Bracket_ColorBGName),
+                               (ScoreRects, self._Bracket_ColorBGScoreBlack),
+                               (WhiteRects, self._Bracket_ColorBGScoreWhite)]:
+            self._ax.add_collection(mpl.collections.PatchCollection(Rects,
+                         match_original = False,
+                         facecolor = Color,
+                         linewidth = 0))
 
 
-    def _Bracket_DrawArrow(self, r, i):
+    def _Bracket_DrawArrows(self):
         """
-        Draw arrow to next round block.
+        Draw arrows from each block to the next round block, for all rounds at once.
         """
-        # Fetch base coordinates of the block with this match
-        (XBase, YBase) = self._Bracket_GetCoordinates(r, i)
+        # Each arrow is a path going right, then up/down, then right again
+        Arrows = []
+        for r in range(self._MatchRounds - 1):
+            MatchesInRound = self._TreeSize >> (r + 1)
+            HalfHeight = self._PowRound[r] * (self._Yh + self._Ys) / 2
+            for i in range(MatchesInRound):
 
-        # First go right
-        plt.arrow(XBase, YBase + self._Yh / 2,
-                  self._Xw - self._Xs, 0,
-                  width = 0.05,
-                  head_width = 0,
-                  head_length = 0,
-                  color = self._Bracket_ColorArrow)
+                # Fetch base coordinates of the block with this match
+                (XBase, YBase) = self._Bracket_GetCoordinates(r, i)
 
-        # Next go up/down depending on parity
-        sgn = (1 if (i % 2 == 0) else -1)
-        plt.arrow(XBase + (self._Xw - self._Xs),
-                  YBase + self._Yh / 2,
-                  0,
-                  sgn * 2**(r-1) * (self._Yh + self._Ys),
-                  width = 0.05,
-                  head_width = 0,
-                  head_length = 0,
-                  color = self._Bracket_ColorArrow)
+                # Go up/down depending on parity
+                XTurn = XBase + (self._Xw - self._Xs)
+                YStart = YBase + self._Yh / 2
+                YEnd = YStart + self._SgnByI[i] * HalfHeight
+                Arrows.append([(XBase, YStart), (XTurn, YStart), (XTurn, YEnd), (XTurn + self._Xs, YEnd)])
 
-        # Then go right
-        plt.arrow(XBase + (self._Xw - self._Xs),
-                  YBase + self._Yh / 2 + sgn * 2**(r-1) * (self._Yh + self._Ys),
-                  self._Xs,
-                  0,
-                  width = 0.05,
-                  head_width = 0,
-                  head_length = 0,
-                  color = self._Bracket_ColorArrow)
+        # Width 0.05 in data coordinates, where one unit is half an inch
+        self._ax.add_collection(mpl.collections.LineCollection(Arrows,
+                     colors = self._Bracket_ColorArrow,
+                     linewidths = 0.05 * 72 / 2,
+                     capstyle = "butt",
+                     joinstyle = "miter"))
+
+
+
+    def _Bracket_Text(self, x, y, s, **kwargs):
+        """
+        Queue a text label, to be drawn in one pass by _Bracket_DrawText.
+        """
+        self._TextQueue.append((x, y, s, kwargs))
+
+
+
+    def _Bracket_DrawText(self):
+        """
+        Draw all queued text labels onto the bracket axes,
+        and return the newly created text artists.
+        """
+        Artists = [self._ax.text(x, y, s, **kwargs) for (x, y, s, kwargs) in self._TextQueue]
+        self._TextQueue = []
+        return Artists
 
 
 
@@ -663,7 +957,7 @@ class KnockOut:
         """
         Add the URL to the tournament in the bottom right corner.
         """
-        plt.text((self._Xn + self._GamesPerMatch * self._Xg)/2 + (round(math.log2(self._TreeSize)) - 1) * self._Xw,
+        self._Bracket_Text((self._Xn + self._GamesPerMatch * self._Xg)/2 + (self._MatchRounds - 1) * self._Xw,
             0.2,
             f"https://lichess.org/swiss/{self._SwissId}",
             fontsize = 12,
@@ -673,67 +967,70 @@ class KnockOut:
 
 
 
-    def _Bracket_DrawRoundTitles(self):
+    def _Bracket_PrecomputeRoundTitles(self):
         """
-        Draw titles above the rounds, to indicate which
-        rounds these are.
+        Precompute the titles above the rounds, which only
+        change when the number of match rounds changes.
         """
-        # Initialize naming
-        RoundNames = {1: "Finals",
-                      2: "Semifinals",
-                      4: "Quarterfinals"}
-        for i in range(3, 15):
-            RoundNames[2**i] = f"Round of {2**(i+1)}"
-
-        # Draw titles for each round
-        for r in range(round(math.log2(self._TreeSize))):
-            MatchesLeft = self._TreeSize // (2 ** (r + 1))
-            plt.text((self._Xn + self._GamesPerMatch * self._Xg)/2 + r * self._Xw,
-                     self._Ytotal - 0.7,
-                     RoundNames[MatchesLeft],
-                     fontsize = 20,
-                     fontweight = "bold",
-                     ha = "center",
-                     va = "center",
-                     color = self._Bracket_ColorName)
-            if self._GamesPerMatch == 1:
-                RoundText = f"(Round {r * self._GamesPerMatch + 1})"
-            else:
-                RoundText = f"(Rounds {r * self._GamesPerMatch + 1}-{(r + 1) * self._GamesPerMatch})"
-            plt.text((self._Xn + self._GamesPerMatch * self._Xg)/2 + r * self._Xw,
-                     self._Ytotal - 1.4,
-                     RoundText,
-                     fontsize = 14,
-                     ha = "center",
-                     va = "center",
-                     color = self._Bracket_ColorName)
+        self._RoundTitleStrings = [self._Bracket_RoundNames[self._TreeSize >> (r + 1)]
+                                   for r in range(self._MatchRounds)]
+        if self._GamesPerMatch == 1:
+            self._RoundSubtitleStrings = [f"(Round {r * self._GamesPerMatch + 1})"
+                                          for r in range(self._MatchRounds)]
+        else:
+            self._RoundSubtitleStrings = [f"(Rounds {r * self._GamesPerMatch + 1}-{(r + 1) * self._GamesPerMatch})"
+                                          for r in range(self._MatchRounds)]
 
 
 
-    def _Bracket_FillMatchBlock(self, r, i):
+    def _Bracket_DrawRoundTitles(self):
         """
-        Fill the match block at coordinate x, y with data.
+        Draw titles above the rounds, to indicate which
+        rounds these are.
+        """
+        # Draw titles for each round
+        for r in range(self._MatchRounds):
+            self._Bracket_Text((self._Xn + self._GamesPerMatch * self._Xg)/2 + r * self._Xw,
+                               self._Ytotal - 0.7,
+                               self._RoundTitleStrings[r],
+                               fontsize = 20,
+                               fontweight = "bold",
+                               ha = "center",
+                               va = "center",
+                               color = self._Bracket_ColorName)
+            self._Bracket_Text((self._Xn + self._GamesPerMatch * self._Xg)/2 + r * self._Xw,
+                               self._Ytotal - 1.4,
+                               self._RoundSubtitleStrings[r],
+                               fontsize = 14,
+                               ha = "center",
+                               va = "center",
+                               color = self._Bracket_ColorName)
+
+
+
+    def _Bracket_FillMatchBlock(self, RoundPairings, r, i):
+        """
+        Fill the match block at coordinate x, y with data,
+        from the pairings RoundPairings of match round r.
         """
         # Fill block starting from the top for match i
         # Compute ip as the ith block from the top
-        ip = self._TreeSize // (2 ** (r + 1)) - i - 1
+        ip = (self._TreeSize >> (r + 1)) - i - 1
         (XBase, YBase) = self._Bracket_GetCoordinates(r, ip)
 
         # Get user information
-        UserName1 = self._Pairings[r][2*i][0]
-        User1 = self._Participants.get(UserName1,
-                    {"username": "BYE", "rating": 0, "points": 0.0, "seed": -1})
-        User1Won = (2 if self._Pairings[r][2*i][1] else
-                    0 if self._Pairings[r][2*i+1][1] else 1)
-        UserScores1 = self._Pairings[r][2*i][2]
+        UserName1 = RoundPairings[2*i][0]
+        User1 = self._Participants.get(UserName1, self._ByeParticipant)
+        User1Won = (2 if RoundPairings[2*i][1] else
+                    0 if RoundPairings[2*i+1][1] else 1)
+        UserScores1 = RoundPairings[2*i][2]
         UserScoreStr1 = self._Bracket_FormatScore(sum(UserScores1))
 
-        UserName2 = self._Pairings[r][2*i+1][0]
-        User2 = self._Participants.get(UserName2,
-                    {"username": "BYE", "rating": 0, "points": 0.0, "seed": -1})
-        User2Won = (2 if self._Pairings[r][2*i+1][1] else
-                    0 if self._Pairings[r][2*i][1] else 1)
-        UserScores2 = self._Pairings[r][2*i+1][2]
+        UserName2 = RoundPairings[2*i+1][0]
+        User2 = self._Participants.get(UserName2, self._ByeParticipant)
+        User2Won = (2 if RoundPairings[2*i+1][1] else
+                    0 if RoundPairings[2*i][1] else 1)
+        UserScores2 = RoundPairings[2*i+1][2]
         UserScoreStr2 = self._Bracket_FormatScore(sum(UserScores2))
 
         MatchUsers = [User1, User2]
@@ -751,21 +1048,20 @@ class KnockOut:
         for j in range(2):
 
             # Put name and rating
-            UserString = f"{MatchUsers[j]['seed']}. {MatchUsers[j]['username']} ({MatchUsers[j]['rating']})"
-            if MatchUsers[j]['username'].lower() == "bye":
-                UserString = "BYE"
-            plt.text(XBase + 0.3,
-                     YBase + self._Yh - (self._Yh / 4) - j * self._Yh / 2,
-                     UserString,
-                     fontsize = 13,
-                     fontweight = self._Bracket_DisplayScores[MatchUserWon[j]]["Weight"],
-                     ha = "left",
-                     va = "center",
-                     color = MatchUserNameColor[j])
+            UserString = ("BYE" if MatchUsers[j]['username'].lower() == "bye" else
+                          f"{MatchUsers[j]['seed']}. {MatchUsers[j]['username']} ({MatchUsers[j]['rating']})")
+            self._Bracket_Text(XBase + 0.3,
+                               YBase + self._Yh - (self._Yh / 4) - j * self._Yh / 2,
+                               UserString,
+                               fontsize = 13,
+                               fontweight = self._Bracket_DisplayScores[MatchUserWon[j]]["Weight"],
+                               ha = "left",
+                               va = "center",
+                               color = MatchUserNameColor[j])
 
             # Put total score, unless BYE
             if ("bye" not in [MatchUsers[k]['username'].lower() for k in range(2)]):
-                plt.text(XBase + self._Xn - 0.8,
+                self._Bracket_Text(XBase + self._Xn - 0.8,
                         YBase + self._Yh - self._Yh / 4 - j * self._Yh / 2,
                         MatchUserScoreStr[j],
                         fontsize = 16,
@@ -775,15 +1071,16 @@ class KnockOut:
                         color = self._Bracket_DisplayScores[MatchUserWon[j]]["Color"])
 
             # Put game results
-            for g in range(len(MatchUserScores[j])):
-                plt.text(XBase + self._Xn + 0.1 + (self._Xg / 2) + g * self._Xg,
-                         YBase + self._Yh - self._Yh / 4 - j * self._Yh / 2,
-                         self._Bracket_FormatScore(MatchUserScores[j][g]),
-                         fontsize = 16,
-                         fontweight = self._Bracket_DisplayScores[round(2*MatchUserScores[j][g])]["WeightGame"],
-                         ha = "center",
-                         va = "center",
-                         color = self._Bracket_DisplayScores[round(2*MatchUserScores[j][g])]["ColorGame"])
+            for g, Score in enumerate(MatchUserScores[j]):
+                k = round(2 * Score)
+                self._Bracket_Text(XBase + self._Xn + 0.1 + (self._Xg / 2) + g * self._Xg,
+                                   YBase + self._Yh - self._Yh / 4 - j * self._Yh / 2,
+                                   self._Bracket_GameScoreLUT[k],
+                                   fontsize = 16,
+                                   fontweight = self._Bracket_GameWeightLUT[k],
+                                   ha = "center",
+                                   va = "center",
+                                   color = self._Bracket_GameColorLUT[k])
 
 
 
@@ -801,15 +1098,15 @@ class KnockOut:
         if self._TreeSize > 4:
             # Show winner with trophy
             im = f"trophies/lichess-gold.png"
-            img = plt.imread(im)
+            img = self._Bracket_LoadImage(im)
             imgar = 1.0
             Xmin = (self._Xn + self._GamesPerMatch * self._Xg)/2 + (self._MatchRounds - 1) * self._Xw
             Xmin = Xmin - 1.5
             Xmax = Xmin + 3
             Ymin = self._Ytotal / 2 + 1.3
             Ymax = Ymin + (Xmax - Xmin) / imgar
-            plt.imshow(img, extent = (Xmin, Xmax, Ymin, Ymax))
-            plt.text(Xmin + 1.5,
+            self._Bracket_DynamicArtists.append(self._ax.imshow(img, extent = (Xmin, Xmax, Ymin, Ymax), aspect = "auto"))
+            self._Bracket_Text(Xmin + 1.5,
                     Ymin - 0.5,
                     self._Participants[self._Winner]["username"],
                         fontsize = 18,
@@ -820,15 +1117,15 @@ class KnockOut:
 
             # Show finals loser with trophy
             im2 = f"trophies/lichess-silver.png"
-            img2 = plt.imread(im2)
+            img2 = self._Bracket_LoadImage(im2)
             imgar2 = 1.0
             Xmin = (self._Xn + self._GamesPerMatch * self._Xg)/2 + (self._MatchRounds - 1) * self._Xw
             Xmin = Xmin - 1
             Xmax = Xmin + 2
             Ymin = self._Ytotal / 2 - 4.5
             Ymax = Ymin + (Xmax - Xmin) / imgar2
-            plt.imshow(img2, extent = (Xmin, Xmax, Ymin, Ymax))
-            plt.text(Xmin + 1,
+            self._Bracket_DynamicArtists.append(self._ax.imshow(img2, extent = (Xmin, Xmax, Ymin, Ymax), aspect = "auto"))
+            self._Bracket_Text(Xmin + 1,
                     Ymin - 0.5,
                     self._Participants[self._Loser]["username"],
                         fontsize = 16,
@@ -841,7 +1138,7 @@ class KnockOut:
             Xmin = (self._Xn + self._GamesPerMatch * self._Xg)/2 + (self._MatchRounds - 1) * self._Xw
             Xmin = Xmin - 1.5
             Ymin = self._Ytotal / 2 + 1.3
-            plt.text(Xmin + 1.5,
+            self._Bracket_Text(Xmin + 1.5,
                     Ymin - 0.5,
                     self._Participants[self._Winner]["username"] + " won!",
                         fontsize = 18,
@@ -857,13 +1154,20 @@ class KnockOut:
         assert (self._TreeSize <= 512), "Too big to draw!"
         assert (self._TreeSize >= 4), "Too small for a tournament!"
         assert (self._TreeSize in {4, 8, 16, 32, 64, 128, 256, 512}), "Tree size not a power of two!"
-        for r in range(round(math.log2(self._TreeSize))):
-            self._Bracket_DrawRoundTitles()
-            for i in range(self._TreeSize // (2 ** (r + 1))):
-                self._Bracket_DrawMatchBlock(r, i)
-                if r < round(math.log2(self._TreeSize)) - 1:
-                    self._Bracket_DrawArrow(r, i)
+        self._Bracket_DrawMatchBlocks()
+        self._Bracket_DrawArrows()
+        self._Bracket_DrawRoundTitles()
         self._Bracket_DrawURL()
+        self._Bracket_DrawText()
+        self._Bracket_SchemeDrawn = True
+
+        # The layout only depends on the empty scheme, so compute it once
+        self._ax.axis("off")
+        self._fig.tight_layout()
+
+        # Render the empty scheme once, and keep the raster as background for later frames
+        self._Canvas.draw()
+        self._Bracket_Background = self._Canvas.copy_from_bbox(self._fig.bbox)
 
 
 
@@ -871,89 +1175,160 @@ class KnockOut:
         """
         Based on pairing data, fill scheme with data and results.
         """
-        # If proper pairings exist
+        # Before start of event, make pretend bracket with only the first round
         if self._Pairings == []:
+            Pairings = [self._InitialPairings()]
+        else:
+            Pairings = self._Pairings
 
-            # Before start of event, make pretend bracket
-            PairingList = []
-            for i in range(self._TreeSize):
-
-                # Get seed number
-                t = trees.Trees[self._TreeSize][i] - 1
-
-                # Store right player in PairingList
-                ListPlayers = list(self._Participants.keys())
-                if t < len(self._Participants):
-                    PairingList.append([ListPlayers[t], False, []])
-                else:
-                    PairingList.append(["BYE", False, []])
-
-            assert (len(PairingList) == self._TreeSize), "Weird pairing list error"
-
-            # Store pairing list
-            self._Pairings.append(PairingList)
+        for r in range(len(Pairings)):
+            MatchesInRound = self._TreeSize >> (r + 1)
+            for i in range(MatchesInRound):
+                self._Bracket_FillMatchBlock(Pairings[r], r, i)
 
-            # After pairings have been finalized, do things properly
-            for r in range(len(self._Pairings)):
-                for i in range(self._TreeSize // (2 ** (r + 1))):
-                    self._Bracket_FillMatchBlock(r, i)
 
-            # Clear pairings again
-            self._Pairings = []
 
-        else:
-            # After pairings have been finalized, do things properly
-            for r in range(len(self._Pairings)):
-                for i in range(self._TreeSize // (2 ** (r + 1))):
-                    self._Bracket_FillMatchBlock(r, i)
+    def _Bracket_Reset(self):
+        """
+        Remove the results from the figure, keeping the empty scheme,
+        so it can be reused for a new drawing.
+        """
+        for Artist in self._Bracket_DynamicArtists:
+            Artist.remove()
+        self._Bracket_DynamicArtists = []
 
 
 
     def _Bracket_Save(self):
         """
         Once the bracket is complete, save it to a file.
+        Only the results are rendered, on top of the cached empty scheme.
         """
-        plt.axis("off")
-        plt.xlim(0, self._Xtotal)
-        plt.ylim(0, self._Ytotal)
-        self._fig.tight_layout()
-        plt.savefig(self._BracketFile())
-        plt.cla()
-        plt.close("all")
+        self._Canvas.restore_region(self._Bracket_Background)
+        for Artist in self._Bracket_DynamicArtists:
+            self._ax.draw_artist(Artist)
+        Image = PIL.Image.fromarray(np.asarray(self._Canvas.buffer_rgba())).convert("RGB")
+
+        # The bracket only has a handful of colors plus anti-aliasing, so a 256-color
+        # palette image looks the same, but is much smaller and faster to encode
+        Image = Image.quantize(colors = 256,
+                               method = PIL.Image.Quantize.FASTOCTREE,
+                               dither = PIL.Image.Dither.NONE)
+        Buffer = io.BytesIO()
+        Image.save(Buffer, format = "PNG")
+        self._BracketBytes = Buffer.getvalue()
+        with open(self._BracketFile, "wb") as file:
+            file.write(self._BracketBytes)
 
 
 
     def _Bracket_Upload(self, New = False):
         """
-        Once the bracket image has been generated, upload it.
+        Once the bracket image has been generated, upload it in the background.
+        If an earlier upload is still waiting in the queue, it is replaced by this one.
         """
-        # Load contents to upload
-        with open(self._BracketFile(), "rb") as file:
-            content = file.read()
-            image_data = bytearray(content)
-            image_bytes = bytes(image_data)
+        # Contents to upload, as kept in memory by _Bracket_Save
+        image_bytes = self._BracketBytes
 
-        # Upload to github
-        git_file = f"png/{self._SwissId}.png"
+        # Skip the upload if the image is the same as the one still being uploaded,
+        # or, if no upload is in progress, the same as the last successful upload
+        BracketHash = hashlib.sha256(image_bytes).digest()
+        if (self._PendingUpload is not None) and (not self._PendingUpload.done()):
+            LastHash = self._PendingUploadHash
+        else:
+            LastHash = self._BracketHash
+        if BracketHash == LastHash:
+            self.tprint("Bracket unchanged, skipping upload.")
+            return
+
+        # Drop a queued upload which has not started yet, as this frame is newer,
+        # and report an earlier upload which failed; either way, a file creation is carried over
+        Previous = self._PendingUpload
+        if Previous is not None:
+            if Previous.cancel():
+                New = New or self._PendingUploadNew
+            elif Previous.done() and (Previous.exception() is not None):
+                self.tprint(f"Earlier bracket upload failed: {Previous.exception()}")
+                New = New or self._PendingUploadNew
+
+        # Commit message describes the state at the time of drawing
         if New:
-            self._GitHubRepo.create_file(git_file,
-                f"Creating new bracket {self._SwissId}.png",
-                image_bytes,
-                branch="main")
-            self.tprint("Uploaded new bracket!")
+            CommitMessage = f"Creating new bracket {self._SwissId}.png"
         else:
-            contents = self._GitHubRepo.get_contents(git_file)
             CommitMessage = f"Updating bracket {self._SwissId}.png"
             if (self._CurMatch > -1) and (self._CurGame > -1):
                 CommitMessage += f" for round {self._CurMatch+1}.{self._CurGame+1}"
             else:
                 CommitMessage += f" before tournament start"
-            self._GitHubRepo.update_file(contents.path,
-                CommitMessage,
-                image_bytes,
-                contents.sha,
-                branch="main")
-            self.tprint("Uploaded updated bracket!")
+
+        self._PendingUpload = self._UploadPool.submit(self._Bracket_UploadNow, image_bytes, BracketHash, New, CommitMessage)
+        self._PendingUploadNew = New
+        self._PendingUploadHash = BracketHash
+
+
+
+    def _Bracket_UploadNow(self, image_bytes, BracketHash, New, CommitMessage):
+        """
+        Upload the bracket image to GitHub, retrying with an exponential backoff.
+        Runs on the upload thread. Only a successful upload records the image hash.
+        """
+        git_file = f"png/{self._SwissId}.png"
+        for i in range(self._ApiAttempts):
+            try:
+                # Also create the file if an earlier creation failed while still running
+                Result = None
+                if New or not self._BracketCreated:
+                    try:
+                        Result = self._GitHubRepo.create_file(git_file,
+                            CommitMessage,
+                            image_bytes,
+                            branch="main")
+                        self.tprint("Uploaded new bracket!")
+                    except github.GithubException as Error:
+                        # An earlier creation may have reached GitHub even though it failed here
+                        if Error.status != 422:
+                            raise
+                        self.tprint("Bracket already exists on GitHub, updating it instead.")
+                        New = False
+                        self._BracketCreated = True
+                        self._BracketSha = None
+                if Result is None:
+                    if self._BracketSha is None:
+                        self._BracketSha = self._GitHubRepo.get_contents(git_file).sha
+                    Result = self._GitHubRepo.update_file(git_file,
+                        CommitMessage,
+                        image_bytes,
+                        self._BracketSha,
+                        branch="main")
+                    self.tprint("Uploaded updated bracket!")
+                self._BracketSha = Result["content"].sha
+                self._BracketCreated = True
+                self._BracketHash = BracketHash
+                return
+            except Exception as e:
+                self.tprint(f"Bracket upload failed ({e}), attempt {i + 1}/{self._ApiAttempts}.")
+                if i == self._ApiAttempts - 1:
+                    # Forget what is on GitHub, so that the same image is uploaded again next time,
+                    # and redraw the next bracket even if its data did not change
+                    self._BracketHash = None
+                    self._Bracket_Signature = None
+                    raise
+                self._BracketSha = None
+                time.sleep(self._ApiDelay * 2 ** i)
+
+
+
+    def _Bracket_WaitForUpload(self):
+        """
+        Block until the last bracket upload has finished.
+        A failed upload is only reported, so that the tournament can still be wrapped up.
+        """
+        if self._PendingUpload is not None:
+            try:
+                self._PendingUpload.result()
+            except Exception as Error:
+                self.tprint(f"Last bracket upload failed: {Error}")
+            self._PendingUpload = None
 
 
 
@@ -962,13 +1337,27 @@ class KnockOut:
         Main routine for drawing a bracket.
         """
         New = True
-        if os.path.exists(self._BracketFile()):
+        if os.path.exists(self._BracketFile):
             New = False
+
+        # Only redraw and upload if any of the data shown in the bracket changed
+        Signature = hashlib.blake2b(repr((self._TreeSize,
+                                          list(self._Participants.items()),
+                                          self._Pairings,
+                                          self._Winner,
+                                          self._Loser)).encode(), digest_size = 16).digest()
+        if (not New) and (Signature == self._Bracket_Signature):
+            self.tprint("Bracket unchanged, skipping redraw.")
+            return
+        self._Bracket_Signature = Signature
+
         self._Bracket_Initialize()
-        self._Bracket_DrawEmptyScheme()
+        if not self._Bracket_SchemeDrawn:
+            self._Bracket_DrawEmptyScheme()
         self._Bracket_FillScheme()
         if self._Winner is not None:
             self._Bracket_DrawWinners()
+        self._Bracket_DynamicArtists += self._Bracket_DrawText()
         self._Bracket_Save()
         self._Bracket_Upload(New)
 
@@ -1005,12 +1394,16 @@ class KnockOut:
 
         # At this point we know the request succeeded, so we can continue
         self.tprint("Tournament creation succeeded!")
-        JResponse = Response.json()
+        JResponse = _JsonLoads(Response.content)
 
         # Store some data in the object
         self._SwissId = JResponse["id"]
         self._SwissUrl = f"https://lichess.org/swiss/{self._SwissId}"
-        self._LogFile = open(f"logs{os.sep}{self._SwissId}.txt", "w")
+        self._BracketFile = f"png{os.sep}{self._SwissId}.png"
+        # Lines are buffered in memory and written out in large blocks,
+        # with a final flush when the script exits, also after sys.exit()
+        self._LogFile = open(f"logs{os.sep}{self._SwissId}.txt", "w", buffering = 1 << 16)
+        atexit.register(self._LogFile.flush)
 
         self.tprint("Opened a new log file.")
 
@@ -1053,49 +1446,47 @@ class KnockOut:
         while not ReadyToStart:
 
             # Stream Lichess list of participants via API and store in temporary variable
-            self._UnconfirmedParticipants = dict()
+            # If the list did not change since the last request, all joins and
+            # departures have already been processed, so there is nothing to update
             RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/results"
-            Response = self._RunGetRequest(RequestEndpoint, True, True)
-            Lines = Response.iter_lines()
-            for Line in Lines:
-                JUser = json.loads(Line.decode("utf-8"))
-                self._UnconfirmedParticipants[JUser["username"].lower()] = JUser
-
-            # Remove departed participants
-            UsersToRemove = dict()
-            for UserName, User in self._Participants.items():
-                if UserName not in self._UnconfirmedParticipants:
+            Response = self._RunGetRequest(RequestEndpoint, True, True, Conditional = True)
+            if Response is not None:
+                JUsers = [_JsonLoads(Line) for Line in Response.content.splitlines()]
+                self._UnconfirmedParticipants = {JUser["username"].lower(): JUser for JUser in JUsers}
+
+                # Remove departed participants
+                UsersToRemove = [UserName for UserName in self._Participants
+                                 if UserName not in self._UnconfirmedParticipants]
+                for UserName in UsersToRemove:
                     self.tprint(f"Removing player {UserName}.")
-                    UsersToRemove[UserName] = UserName
+                    self._Participants.pop(UserName)
+                    self._ParticipantsDirty = True
 
-            # Remove users that left
-            for UserName in UsersToRemove:
-                self._Participants.pop(UserName)
+                # Add newly registered participants, if there is place
+                for UserName, User in self._UnconfirmedParticipants.items():
+                    if len(self._Participants) == self._MaxParticipants:
+                        break
 
-            # Add newly registered participants, if there is place
-            for UserName, User in self._UnconfirmedParticipants.items():
-                if len(self._Participants) == self._MaxParticipants:
-                    break
+                    if UserName not in self._Participants:
+                        self.tprint(f"Adding player {UserName}.")
+                        self._Participants[UserName] = User
+                        self._ParticipantsDirty = True
 
-                if UserName not in self._Participants:
-                    self.tprint(f"Adding player {UserName}.")
-                    self._Participants[UserName] = User
+                        # If we reached the limit, stop registration and prepare to start the event
+                        if len(self._Participants) >= self._MaxParticipants:
 
-                    # If we reached the limit, stop registration and prepare to start the event
-                    if len(self._Participants) >= self._MaxParticipants:
+                            # Sanity checks on current parameters
+                            assert (len(self._UnconfirmedParticipants) >= self._MaxParticipants), "How can this be if we reached the limit?"
+                            assert (len(self._Participants) == self._MaxParticipants), "More than the limit?!"
 
-                        # Sanity checks on current parameters
-                        assert (len(self._UnconfirmedParticipants) >= self._MaxParticipants), "How can this be if we reached the limit?"
-                        assert (len(self._Participants) == self._MaxParticipants), "More than the limit?!"
+                            self.tprint("Reached maximum participants!")
 
-                        self.tprint("Reached maximum participants!")
+                            # Jump out of the loop to start the event
+                            if self._StartAtMax:
+                                ReadyToStart = True
 
-                        # Jump out of the loop to start the event
-                        if self._StartAtMax:
-                            ReadyToStart = True
-
-                        # Stop adding more players
-                        break
+                            # Stop adding more players
+                            break
 
             # Do a further return in case we wish to start early
             if ReadyToStart:
@@ -1112,19 +1503,11 @@ class KnockOut:
                 ReadyToStart = True
                 break
 
-            # Sort participants by rating or randomize seeds
-            if self._RandomizeSeeds:
-                # Do random shuffle of seeds
-                TempList = list(self._Participants.items())
-                random.shuffle(TempList)
-                self._Participants = dict(TempList)
-            else:
-                # Sort by rating
-                self._Participants = dict(sorted(self._Participants.items(), key=lambda item: item[1]["rating"], reverse = True))
-
-            # Assign seeds to participants
-            for Seed, User in enumerate(self._Participants.values()):
-                User["seed"] = Seed + 1
+            # Sort participants by rating or randomize seeds,
+            # which only has to be redone if players joined or left
+            if self._ParticipantsDirty:
+                self._SeedParticipants()
+                self._ParticipantsDirty = False
 
             self.PrintParticipants()
 
@@ -1136,10 +1519,14 @@ class KnockOut:
             if (TimeLeft < 60000) or ((self._StartAtMax) and (SpotsLeft < 30)):
                 self.tprint(f"Close to starting ({len(self._Participants)}/{self._MaxParticipants} participants)...")
                 # time.sleep(self._ApiDelay)
-            # Otherwise: make API queries every 10 seconds
-            else:
+            # Less than five minutes left: make API queries every 10 seconds
+            elif (TimeLeft < 300000):
                 self.tprint(f"Not yet starting ({len(self._Participants)}/{self._MaxParticipants}), so sleeping for another 10 seconds...")
                 time.sleep(10)
+            # Otherwise: make API queries every 30 seconds
+            else:
+                self.tprint(f"Not starting soon ({len(self._Participants)}/{self._MaxParticipants}), so sleeping for another 30 seconds...")
+                time.sleep(30)
 
         # EndWhile
 
@@ -1152,19 +1539,7 @@ class KnockOut:
             self.tprint("Enough players to start!")
 
         # Sort participants by rating or randomize seeds
-        if self._RandomizeSeeds:
-            # Do random shuffle of seeds
-            TempList = list(self._Participants.items())
-            random.shuffle(TempList)
-            self._Participants = dict(TempList)
-        else:
-            # Sort by rating
-            self._Participants = dict(sorted(self._Participants.items(), key=lambda item: item[1]["rating"], reverse = True))
-
-        # Assign seeds to participants
-        for Seed, User in enumerate(self._Participants.values()):
-            User["seed"] = Seed + 1
-
+        self._SeedParticipants()
         self.PrintParticipants()
 
         # Reduce waiting time to start event in at most 30 seconds
@@ -1172,11 +1547,7 @@ class KnockOut:
         if TimeLeft > 30000:
             self._StartTime = 1000 * round(time.time()) + 30000
             ResponseEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
-            ResponseData = dict()
-            ResponseData["clock.limit"]             = self._ClockInit
-            ResponseData["clock.increment"]         = self._ClockInc
-            ResponseData["nbRounds"]                = self._TotalRounds
-            ResponseData["conditions.allowList"]    = self._AllowedPlayers
+            ResponseData = self._EditRequestData()
             ResponseData["startsAt"]                = self._StartTime
             Response = self._RunPostRequest(ResponseEndpoint, ResponseData, True)
 
@@ -1194,14 +1565,8 @@ class KnockOut:
         # Set list of allowed participants in API to current list of participants
         self._AllowedPlayers = "\n".join(self._Participants.keys())
 
-        # Prepare proper post request
-        RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
-        RequestData = dict()
-        RequestData["clock.limit"]          = self._ClockInit
-        RequestData["clock.increment"]      = self._ClockInc
-        RequestData["nbRounds"]             = self._TotalRounds
-        RequestData["conditions.allowList"] = self._AllowedPlayers
-        _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
+        # The field is final now, so keep a flat lookup of ratings for tiebreaks
+        self._RatingByPlayer = {UserName: User["rating"] for UserName, User in self._Participants.items()}
 
         # Message players who were left out
         for UserName in self._UnconfirmedParticipants:
@@ -1209,7 +1574,7 @@ class KnockOut:
                 self.tprint(f"Sorry {UserName}, you were too late!")
 
         # Update rounds if fewer participants than expected
-        ActualMatchRounds = math.ceil(math.log2(len(self._Participants)))
+        ActualMatchRounds = (len(self._Participants) - 1).bit_length()
         self._TreeSize = 2 ** ActualMatchRounds
 
         assert (len(self._Participants) <= self._TreeSize), "Tree size inconsistent! (too small)"
@@ -1219,14 +1584,13 @@ class KnockOut:
             self.tprint("Updating number of rounds on Lichess...")
             self._MatchRounds = ActualMatchRounds
             self._TotalRounds = self._MatchRounds * self._GamesPerMatch
-            ResponseEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
-            ResponseData = dict()
-            ResponseData["clock.limit"]             = self._ClockInit
-            ResponseData["clock.increment"]         = self._ClockInc
-            ResponseData["nbRounds"]                = self._TotalRounds
-            ResponseData["conditions.allowList"]    = self._AllowedPlayers
-            self._RunPostRequest(ResponseEndpoint, ResponseData, True)
-            self.tprint("Finished updating API!")
+            self._Bracket_PrecomputeRoundTitles()
+
+        # Send the final list of participants and number of rounds in one request
+        RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
+        RequestData = self._EditRequestData()
+        _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
+        self.tprint("Finished updating API!")
 
         # Make bracket and save locally
         self.tprint("Making the complete bracket...")
@@ -1249,23 +1613,7 @@ class KnockOut:
         if self._CurMatch == 0:
 
             # Create initial list of participants from seed tree
-            PairingList = []
-            for i in range(self._TreeSize):
-
-                # Get seed number
-                t = trees.Trees[self._TreeSize][i] - 1
-
-                # Store right player in PairingList
-                ListPlayers = list(self._Participants.keys())
-                if t < len(self._Participants):
-                    PairingList.append([ListPlayers[t], False, []])
-                else:
-                    PairingList.append(["BYE", False, []])
-
-            assert (len(PairingList) == self._TreeSize), "Weird pairing list error"
-
-            # Store pairing list
-            self._Pairings.append(PairingList)
+            self._Pairings.append(self._InitialPairings())
 
         # Other match rounds
         else:
@@ -1273,15 +1621,16 @@ class KnockOut:
             # Create new pairings from previous results
             PairingList = []
 
-            for i in range(len(self._Pairings[-1]) // 2):
+            Round = self._Pairings[-1]
+            for i in range(len(Round) // 2):
 
-                assert (self._Pairings[-1][2*i][1] != self._Pairings[-1][2*i+1][1]), "Previous pairings not complete!"
+                assert (Round[2*i][1] != Round[2*i+1][1]), "Previous pairings not complete!"
 
                 # Pass winner to next round
-                if self._Pairings[-1][2*i][1]:
-                    PairingList.append([self._Pairings[-1][2*i][0], False, []])
+                if Round[2*i][1]:
+                    PairingList.append([Round[2*i][0], False, []])
                 else:
-                    PairingList.append([self._Pairings[-1][2*i+1][0], False, []])
+                    PairingList.append([Round[2*i+1][0], False, []])
 
             self._Pairings.append(PairingList)
 
@@ -1307,40 +1656,43 @@ class KnockOut:
         """
         self.tprint(f"Starting round {self._CurMatch+1}.{self._CurGame+1} ({self._GetRound()+1})...")
 
+        Round = self._Pairings[-1]
+
         # Do sanity check that pairings are ready
-        assert (len(self._Pairings[-1]) >= 2), "No games to pair!"
-        assert (len(self._Pairings[-1]) % 2 == 0), "Odd number of players to pair!"
+        assert (len(Round) >= 2), "No games to pair!"
+        assert (len(Round) % 2 == 0), "Odd number of players to pair!"
+
+        # Whether the bottom player of each match gets white in this game, the same for all matches
+        SwapColors = (self._CurGame % 2 == (1 - ((self._TopGetsWhiteBits >> self._CurMatch) & 1)))
 
         # Compute manual pairings to push to Lichess API
         PairingList = []
-        for i in range(len(self._Pairings[-1]) // 2):
+        for i in range(len(Round) // 2):
 
             # Extract players for this game
-            Player1 = self._Pairings[-1][2*i][0]
-            Player2 = self._Pairings[-1][2*i+1][0]
+            Player1 = Round[2*i][0]
+            Player2 = Round[2*i+1][0]
 
             # Take care of byes in the pairing tree
             if Player1 == "BYE" or Player2 == "BYE":
                 if Player1 == "BYE":
-                    self._Pairings[-1][2*i+1][1] = True
+                    Round[2*i+1][1] = True
                 else: # if Player2 == "BYE"
-                    self._Pairings[-1][2*i][1] = True
+                    Round[2*i][1] = True
 
             # Calculate game pairings for this game round
-            if self._Pairings[-1][2*i][1] or self._Pairings[-1][2*i+1][1]:
+            if Round[2*i][1] or Round[2*i+1][1]:
                 # Match decided? Give a full point
-                if self._Pairings[-1][2*i][1]:
+                if Round[2*i][1]:
                     PairingList.append(f"{Player1} 1")
-                else: # if self._Pairings[-1][2*i+1][1]
+                else: # if Round[2*i+1][1]
                     PairingList.append(f"{Player2} 1")
             else:
-                # Match undecided, make proper game pairing
-                if self._CurGame % 2 == (1 - self._TopGetsWhite[self._CurMatch]):
-                    # Swap order
-                    PlayerTemp = Player1
-                    Player1 = Player2
-                    Player2 = PlayerTemp
-                PairingList.append(f"{Player1} {Player2}")
+                # Match undecided, make proper game pairing, with white listed first
+                if SwapColors:
+                    PairingList.append(f"{Player2} {Player1}")
+                else:
+                    PairingList.append(f"{Player1} {Player2}")
 
         self.PrintMatches()
 
@@ -1358,37 +1710,24 @@ class KnockOut:
         # RequestData["manualPairings"]       = self._CurPairings
         # _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
 
-        # Update game start time to 15 seconds from now
+        # Push the manual pairings to the API, Lichess API endpoint .../edit
+        self.tprint("Pushing pairings to API...")
         NewRoundStartTime = 1000 * round(time.time()) + 15000
+        RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
+        RequestData = self._EditRequestData()
+        RequestData["manualPairings"]       = self._CurPairings
         if self._GetRound() == 0:
-            # Tournament start, Lichess API endpoint .../edit
-            RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
-            RequestData = dict()
-            RequestData["clock.limit"]          = self._ClockInit
-            RequestData["clock.increment"]      = self._ClockInc
-            RequestData["nbRounds"]             = self._TotalRounds
-            RequestData["conditions.allowList"] = self._AllowedPlayers
-            RequestData["manualPairings"]       = self._CurPairings
-            RequestData["startsAt"]             = NewRoundStartTime
-            _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
-        else:
+            # Tournament start, set game start time to 15 seconds from now in the same request
+            RequestData["startsAt"]         = NewRoundStartTime
+        _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
+
+        if self._GetRound() > 0:
             # New round start, Lichess API endpoint .../schedule-next-round
             RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/schedule-next-round"
             RequestData = dict()
             RequestData["date"]                 = NewRoundStartTime
             _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
 
-        # Push the manual pairings to the API again to make sure
-        self.tprint("Pushing pairings to API...")
-        RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/edit"
-        RequestData = dict()
-        RequestData["clock.limit"]          = self._ClockInit
-        RequestData["clock.increment"]      = self._ClockInc
-        RequestData["nbRounds"]             = self._TotalRounds
-        RequestData["conditions.allowList"] = self._AllowedPlayers
-        RequestData["manualPairings"]       = self._CurPairings
-        _ = self._RunPostRequest(RequestEndpoint, RequestData, True)
-
         # Update the bracket
         self.tprint(f"Updating the bracket...")
         self._Bracket_MakeBracket()
@@ -1409,9 +1748,12 @@ class KnockOut:
 
         while True:
             # Get Lichess response how many games are running
+            # If the state did not change since the last request, keep the previous one
             RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}"
-            Response = self._RunGetRequest(RequestEndpoint, True, True)
-            JResponse = Response.json()
+            Response = self._RunGetRequest(RequestEndpoint, True, True, Conditional = True)
+            if Response is not None:
+                self._SwissStatus = _JsonLoads(Response.content)
+            JResponse = self._SwissStatus
 
             if (JResponse["round"] == self._GetRound() + 1) and (JResponse["nbOngoing"] == 0):
                 # Games have all finished
@@ -1437,9 +1779,8 @@ class KnockOut:
         GameScores = dict()
         RequestEndpoint = f"https://lichess.org/api/swiss/{self._SwissId}/results"
         Response = self._RunGetRequest(RequestEndpoint, True, True)
-        Lines = Response.iter_lines()
-        for Line in Lines:
-            JUser = json.loads(Line.decode("utf-8"))
+        for Line in Response.content.splitlines():
+            JUser = _JsonLoads(Line)
             UserName = JUser["username"].lower()
             if UserName not in self._Participants:
                 continue
@@ -1447,30 +1788,31 @@ class KnockOut:
             self._Participants[UserName]["points"] = JUser["points"]
         GameScores["BYE"] = 0
 
+        Round = self._Pairings[-1]
         # Process all matches one by one
-        for i in range(len(self._Pairings[-1]) // 2):
+        for i in range(len(Round) // 2):
 
             # Extract players for this game
-            Player1 = self._Pairings[-1][2*i][0]
-            Player2 = self._Pairings[-1][2*i+1][0]
+            Player1 = Round[2*i][0]
+            Player2 = Round[2*i+1][0]
 
             assert (GameScores[Player1] + GameScores[Player2] == 1), f"Error: {Player1} {GameScores[Player1]} - {GameScores[Player2]} {Player2}"
 
             # Store results in self._Pairings
-            if self._Pairings[-1][2*i][1] or self._Pairings[-1][2*i+1][1]:
+            if Round[2*i][1] or Round[2*i+1][1]:
                 # Match was decided before this game
                 continue
 
             # Match not yet decided, an actual game took place, update scores
-            self._Pairings[-1][2*i][2].append(GameScores[Player1])
-            self._Pairings[-1][2*i+1][2].append(GameScores[Player2])
+            Round[2*i][2].append(GameScores[Player1])
+            Round[2*i+1][2].append(GameScores[Player2])
 
             # Compute potential match winners in the bracket
-            (Player1Won, Player2Won) = self._MatchDecided(self._Pairings[-1][2*i], self._Pairings[-1][2*i+1])
+            (Player1Won, Player2Won) = self._MatchDecided(Round[2*i], Round[2*i+1])
 
             # Store match results in self._Pairings
-            self._Pairings[-1][2*i][1] = Player1Won
-            self._Pairings[-1][2*i+1][1] = Player2Won
+            Round[2*i][1] = Player1Won
+            Round[2*i+1][1] = Player2Won
 
         self.PrintMatches()
 
@@ -1484,17 +1826,8 @@ class KnockOut:
         """
         self.tprint(f"Concluding match round {self._CurMatch+1}...")
 
-        # Process all matches one by one
-        for i in range(len(self._Pairings[-1]) // 2):
-
-            # Compute match winners in the bracket
-            (Player1Won, Player2Won) = self._MatchDecided(self._Pairings[-1][2*i], self._Pairings[-1][2*i+1])
-
-            assert (Player1Won or Player2Won), "Match undecided?"
-
-            # Store match results in self._Pairings
-            self._Pairings[-1][2*i][1] = Player1Won
-            self._Pairings[-1][2*i+1][1] = Player2Won
+        # Winners were already stored by _FinishGames as each game came in
+        assert self._AllMatchesDecided(), "Match undecided?"
 
         self.PrintMatches()
 
@@ -1512,17 +1845,24 @@ class KnockOut:
         self.tprint("Finalizing the tournament...")
 
         # Wrap up winners/losers
-        if self._Pairings[-1][0][1]:
-            self._Winner = self._Pairings[-1][0][0]
-            self._Loser = self._Pairings[-1][1][0]
+        Round = self._Pairings[-1]
+        if Round[0][1]:
+            self._Winner = Round[0][0]
+            self._Loser = Round[1][0]
         else:
-            self._Winner = self._Pairings[-1][1][0]
-            self._Loser = self._Pairings[-1][0][0]
+            self._Winner = Round[1][0]
+            self._Loser = Round[0][0]
         self.tprint(f"Winner: {self._Winner}!")
         self.tprint(f"Runner-up: {self._Loser}.")
 
-        # Update the final bracket
+        # Update the final bracket, and make sure it reached GitHub
         self._Bracket_MakeBracket()
+        self._Bracket_WaitForUpload()
+
+        # The bracket figure is kept alive throughout the tournament, release it now
+        plt.close(self._fig)
+        self._fig = None
+        self._ax = None
 
         EndMessage = f"Thanks to those who played in the event! Congrats to the winner {self._Winner}!"
         # f"https://lichess.org/team/{self._TeamId}/pm-all"
@@ -1559,3 +1899,4 @@ class KnockOut:
             self._FinishMatches()                   # Last games have finished, decide winners/tiebreaks
         self._Finalize()                            # Finalize Lichess event
         self._Terminate()                           # End the tournament, in case it did not already finish
+        self._CloseSessions()                       # Release the pooled HTTP connections
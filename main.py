@@ -3,6 +3,13 @@ import knockout
 import os
 import sys
 
+def ReadToken(FileName: str) -> str:
+    """
+    Read an API token from the first line of a text file.
+    """
+    with open(FileName) as TokenFile:
+        return TokenFile.readline().strip()
+
 if __name__ == "__main__":
 
     # Set up argument parser for the right parameters
@@ -48,8 +55,7 @@ if __name__ == "__main__":
         LichessToken = Args.lichess
     else:
         assert (os.path.exists(Args.lichessfile)), "Lichess token file does not exist"
-        with open(Args.lichessfile) as LichessTokenFile:
-            LichessToken = LichessTokenFile.readline().strip()
+        LichessToken = ReadToken(Args.lichessfile)
     assert ("lip_" in LichessToken), "Lichess token not of the right format"
 
     # Parse the GitHub token
@@ -57,8 +63,7 @@ if __name__ == "__main__":
         GitHubToken = Args.github
     else:
         assert (os.path.exists(Args.githubfile)), "GitHub token file does not exist"
-        with open(Args.githubfile) as GitHubTokenFile:
-            GitHubToken = GitHubTokenFile.readline().strip()
+        GitHubToken = ReadToken(Args.githubfile)
     assert ("github_" in GitHubToken), "GitHub token not of the right format"
 
     # Set up the knockout tournament runner